@@ -2,9 +2,13 @@ import os
 import json
 import asyncio
 import datetime
+import time
 import random
+import itertools
 import logging
 import math
+import hashlib
+import tempfile
 from pathlib import Path
 from zoneinfo import ZoneInfo
 from typing import Optional, Any
@@ -61,13 +65,18 @@ try:
 except Exception as e:
     raise SystemExit(f"Invalid TIMEZONE '{TIMEZONE}': {e}")
 
+_UTC = datetime.timezone.utc
+
+TARGET_TIME = datetime.time(TARGET_HOUR, TARGET_MINUTE, tzinfo=TZ)
+
 CATCH_UP = os.getenv("CATCH_UP", "false").strip().lower() in ("1", "true", "yes", "y", "on")
 CATCH_UP_MAX_HOURS = _read_optional_float_env("CATCH_UP_MAX_HOURS")
 DRY_RUN = os.getenv("DRY_RUN", "false").strip().lower() in ("1", "true", "yes", "y", "on")
 
 MESSAGE = "take out the trash @everyone"
+MESSAGE_NO_PING = MESSAGE.replace("@everyone", "").strip()
 
-TRASH_GIFS = [
+TRASH_GIFS = (
     "https://media.giphy.com/media/QuvgjttKi5GL4TPtLB/giphy.gif",
     "https://media.giphy.com/media/tVOlt6mzRFNPuLFL40/giphy.gif",
     "https://media.giphy.com/media/FYXNxV12QG4HspSgOo/giphy.gif",
@@ -75,12 +84,33 @@ TRASH_GIFS = [
     "https://media.giphy.com/media/26ufffLixTAsLgA8g/giphy.gif",
     "https://media.giphy.com/media/11Y9TiZzmEBe25QRSw/giphy.gif",
     "https://media.giphy.com/media/5xaOcLCBzBw4QrtdDP2/giphy.gif",
-]
+)
 
 if not TRASH_GIFS:
     raise SystemExit("TRASH_GIFS is empty. Add at least one GIF URL.")
 
+# Shuffled once at startup, then rotated, so consecutive sends don't repeat a GIF.
+_gif_cycle = itertools.cycle(random.sample(TRASH_GIFS, len(TRASH_GIFS)))
+
 STATE_PATH = Path(__file__).with_name("state.json")
+STATE_JOURNAL = Path(__file__).with_name("state.jsonl")
+
+# state.json gets the mode a plain open() would give it (0o666 minus the umask),
+# whichever temp-file path wrote it. mkstemp ignores the umask, so it is needed
+# explicitly; os.umask() can only be read by setting it, done once here at import
+# before any worker threads exist.
+_umask = os.umask(0)
+os.umask(_umask)
+STATE_FILE_MODE = 0o666 & ~_umask
+
+# Guild sends run concurrently; cap how many are in flight at once.
+SEND_CONCURRENCY = 20
+
+# Wall vs monotonic disagreement beyond this is treated as a clock jump.
+CLOCK_DRIFT_SECONDS = 60.0
+
+# Upper bound on a single scheduler sleep, so suspend/resume clock jumps are noticed.
+SLEEP_CHUNK_SECONDS = 3600.0
 
 LOG_LEVEL_STR = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
@@ -102,6 +132,12 @@ if DRY_RUN:
 intents = discord.Intents.default()
 client = discord.Client(intents=intents)
 
+_AM_EVERYONE = discord.AllowedMentions(everyone=True)
+_AM_NONE = discord.AllowedMentions(everyone=False)
+
+_schedule_task: Optional[asyncio.Task] = None
+_fixed_channel: Optional[discord.abc.Messageable] = None
+
 
 def can_mention_everyone_in_channel(channel: Any) -> bool:
     """
@@ -110,9 +146,10 @@ def can_mention_everyone_in_channel(channel: Any) -> bool:
 
     Note: This can under-report True if member caching is incomplete.
     """
-    guild = getattr(channel, "guild", None)
-    if guild is None:
+    # Threads carry a guild but are not GuildChannel subclasses.
+    if not isinstance(channel, (discord.abc.GuildChannel, discord.Thread)):
         return False
+    guild = channel.guild
 
     me = guild.me
     if me is None:
@@ -124,23 +161,26 @@ def can_mention_everyone_in_channel(channel: Any) -> bool:
 
     try:
         perms = channel.permissions_for(me)
-        return bool(getattr(perms, "mention_everyone", False))
+        return perms.mention_everyone
     except Exception:
         return False
 
 
+def _candidate_this_week(now_local: datetime.datetime) -> datetime.datetime:
+    """
+    Returns the scheduled time on the next TARGET_WEEKDAY on or after now_local's date.
+    """
+    days_forward = (TARGET_WEEKDAY - now_local.weekday()) % 7
+    target_date = now_local.date() + datetime.timedelta(days=days_forward)
+    return datetime.datetime.combine(target_date, TARGET_TIME)
+
+
 def scheduled_run_for_week(now_local: datetime.datetime) -> datetime.datetime:
     """
     Returns the most recent scheduled time (this week) at TARGET_WEEKDAY/TARGET_HOUR/TARGET_MINUTE
     that is <= now_local.
     """
-    days_forward = (TARGET_WEEKDAY - now_local.weekday()) % 7
-    candidate = (now_local + datetime.timedelta(days=days_forward)).replace(
-        hour=TARGET_HOUR,
-        minute=TARGET_MINUTE,
-        second=0,
-        microsecond=0,
-    )
+    candidate = _candidate_this_week(now_local)
 
     # If this week's candidate is in the future, the most recent run was last week.
     if candidate > now_local:
@@ -149,18 +189,11 @@ def scheduled_run_for_week(now_local: datetime.datetime) -> datetime.datetime:
     return candidate
 
 
-
 def next_run_after(now_local: datetime.datetime) -> datetime.datetime:
     """
     Returns the next scheduled run strictly after now_local.
     """
-    days_forward = (TARGET_WEEKDAY - now_local.weekday()) % 7
-    candidate = (now_local + datetime.timedelta(days=days_forward)).replace(
-        hour=TARGET_HOUR,
-        minute=TARGET_MINUTE,
-        second=0,
-        microsecond=0,
-    )
+    candidate = _candidate_this_week(now_local)
 
     if candidate <= now_local:
         candidate += datetime.timedelta(days=7)
@@ -168,20 +201,68 @@ def next_run_after(now_local: datetime.datetime) -> datetime.datetime:
     return candidate
 
 
+def _can_post(ch: discord.TextChannel, me: discord.Member) -> bool:
+    perms = ch.permissions_for(me)
+    return perms.view_channel and perms.send_messages
+
 
 def pick_channel(guild: discord.Guild) -> Optional[discord.TextChannel]:
     me = guild.me
     if me is None:
         return None
 
+    # Administrators bypass every channel overwrite, so no per-channel check is needed:
+    # take the system channel, else the top-most text channel found in one pass over
+    # the guild's channel map (no sorted list as guild.text_channels would build).
+    if me.guild_permissions.administrator:
+        if guild.system_channel is not None:
+            return guild.system_channel
+        return min(
+            (ch for ch in guild._channels.values() if isinstance(ch, discord.TextChannel)),
+            key=lambda ch: (ch.position, ch.id),
+            default=None,
+        )
+
+    # The system channel is Discord's "default" channel and the usual answer; try it before scanning.
+    if guild.system_channel is not None and _can_post(guild.system_channel, me):
+        return guild.system_channel
+
+    # Permission checks are the expensive part, so scan in channel order and stop at the
+    # first postable one (usually the first channel checked).
     for ch in guild.text_channels:
-        perms = ch.permissions_for(me)
-        if perms.view_channel and perms.send_messages:
+        if _can_post(ch, me):
             return ch
     return None
 
 
-def _load_state() -> dict:
+def _cached_channel(state: dict, guild: discord.Guild) -> Optional[discord.TextChannel]:
+    """
+    Returns the channel picked for this guild on a previous run, if it still exists
+    and is still postable. Returns None on any miss so the caller can fall back to pick_channel.
+    """
+    picked = state.get("picked_channel")
+    if not isinstance(picked, dict):
+        return None
+
+    ch_id = picked.get(str(guild.id))
+    if not isinstance(ch_id, int):
+        return None
+
+    ch = guild.get_channel(ch_id)
+    me = guild.me
+    if not isinstance(ch, discord.TextChannel) or me is None:
+        return None
+    return ch if _can_post(ch, me) else None
+
+
+def _remember_channel(state: dict, guild_id: int, channel_id: int) -> None:
+    picked = state.get("picked_channel")
+    if not isinstance(picked, dict):
+        picked = state["picked_channel"] = {}
+    picked[str(guild_id)] = channel_id
+
+
+def _read_state_file() -> dict:
     try:
         if not STATE_PATH.exists():
             return {}
@@ -189,20 +270,182 @@ def _load_state() -> dict:
             data = json.load(f)
         return data if isinstance(data, dict) else {}
     except Exception as e:
-        logger.warning(f"Failed to load state file: {e}, starting fresh")
+        logger.warning("Failed to load state file: %s, starting fresh", e)
         return {}
 
 
-def _save_state(state: dict) -> None:
-    tmp = STATE_PATH.with_suffix(".json.tmp")
+def _replay_journal(state: dict) -> int:
+    """
+    Folds state.jsonl into state (last write wins per key). Returns the number of non-blank
+    lines read, malformed ones included, so the caller compacts whenever the journal had content.
+    """
+    lines = 0
     try:
-        with tmp.open("w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2, sort_keys=True)
-            f.write("\n")
-        tmp.replace(STATE_PATH)
-        logger.debug(f"State saved with {len(state)} entries")
+        if not STATE_JOURNAL.exists():
+            return 0
+        with STATE_JOURNAL.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                lines += 1
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn line from a crash mid-append. Compacting drops it, so a later
+                    # append can't be glued onto it and lost as well.
+                    logger.warning("Skipping malformed state journal line")
+                    continue
+                if not isinstance(entry, dict):
+                    continue
+
+                key = entry.get("key")
+                run_at = entry.get("run_at")
+                if isinstance(key, str) and isinstance(run_at, (int, str)) and not isinstance(run_at, bool):
+                    state[key] = run_at
+
+                guild_id = entry.get("guild")
+                channel_id = entry.get("channel")
+                if isinstance(guild_id, int) and isinstance(channel_id, int):
+                    _remember_channel(state, guild_id, channel_id)
     except Exception as e:
-        logger.error(f"Failed to save state: {e}")
+        logger.warning("Failed to replay state journal: %s", e)
+    return lines
+
+
+def _load_state() -> dict:
+    state = _read_state_file()
+    if _replay_journal(state):
+        _compact_state(state)
+    return state
+
+
+def _fsync_dir(path: Path) -> None:
+    """
+    Flushes directory metadata (e.g. a rename) to disk. Directories cannot be opened this way on Windows.
+    """
+    if os.name != "posix":
+        return
+    dir_fd = os.open(str(path), os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _write_verified(f: Any, payload: bytes) -> None:
+    f.write(payload)
+    f.flush()
+    os.fsync(f.fileno())
+
+    # Read the temp file back before it replaces the good copy.
+    f.seek(0)
+    if hashlib.sha256(f.read()).digest() != hashlib.sha256(payload).digest():
+        raise IOError("state.json write_corruption: readback digest mismatch")
+
+
+def _write_state_tmp(payload: bytes) -> str:
+    """
+    Writes payload to a new, verified temp file next to STATE_PATH and returns its path.
+
+    On Linux the file starts as an anonymous O_TMPFILE inode and is only linked in once
+    fully written, so a crash mid-write leaves nothing behind. Otherwise (or if linking
+    the inode is refused) it is a uniquely named O_EXCL file from tempfile, so leftover
+    or concurrent temp files are never reused.
+    """
+    if hasattr(os, "O_TMPFILE") and os.path.isdir("/proc/self/fd"):
+        try:
+            fd = os.open(str(STATE_PATH.parent), os.O_TMPFILE | os.O_RDWR, STATE_FILE_MODE)
+        except OSError:
+            fd = None  # Filesystem without O_TMPFILE support.
+        if fd is not None:
+            with os.fdopen(fd, "w+b") as f:
+                _write_verified(f, payload)
+                path = str(STATE_PATH.parent / f".state.{os.urandom(8).hex()}.tmp")
+                try:
+                    os.link(f"/proc/self/fd/{f.fileno()}", path)
+                    return path
+                except OSError:
+                    pass
+
+    fd, path = tempfile.mkstemp(dir=str(STATE_PATH.parent), prefix=".state.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w+b") as f:
+            # mkstemp always creates 0600; match the O_TMPFILE path.
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), STATE_FILE_MODE)
+            _write_verified(f, payload)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+def _save_state(state: dict) -> bool:
+    try:
+        payload = (json.dumps(state, indent=2, sort_keys=True) + "\n").encode("utf-8")
+        tmp = _write_state_tmp(payload)
+        try:
+            os.replace(tmp, STATE_PATH)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        _fsync_dir(STATE_PATH.parent)
+        logger.debug("State saved with %d entries", len(state))
+        return True
+    except Exception as e:
+        logger.error("Failed to save state: %s", e)
+        return False
+
+
+def _compact_state(state: dict) -> None:
+    """
+    Rewrites state.json from the folded state and drops the journal.
+    The journal is only removed once the rewrite has succeeded.
+    """
+    if not _save_state(state):
+        return
+    try:
+        STATE_JOURNAL.unlink(missing_ok=True)
+    except Exception as e:
+        logger.error("Failed to truncate state journal: %s", e)
+
+
+def _append_journal(entry: dict) -> None:
+    try:
+        with STATE_JOURNAL.open("a+b") as f:
+            # If a torn line survived (compaction failed), start on a fresh line.
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write((json.dumps(entry, sort_keys=True) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+    except Exception as e:
+        logger.error("Failed to append state journal: %s", e)
+
+
+async def _record_sent(
+    state: dict,
+    target_key: str,
+    run_at: datetime.datetime,
+    guild_id: Optional[int] = None,
+    channel_id: Optional[int] = None,
+) -> None:
+    """
+    Marks target_key as sent for run_at, in memory and as one appended line in state.jsonl.
+    The in-memory update happens before any await; the fsynced append runs in a worker
+    thread so concurrent sends and gateway heartbeats don't wait on the disk.
+    """
+    state[target_key] = int(run_at.timestamp())
+    entry: dict = {"key": target_key, "run_at": state[target_key]}
+    if guild_id is not None and channel_id is not None:
+        _remember_channel(state, guild_id, channel_id)
+        entry["guild"] = guild_id
+        entry["channel"] = channel_id
+
+    await asyncio.to_thread(_append_journal, entry)
 
 
 def _make_target_key(channel_id: Optional[int], guild_id: Optional[int]) -> str:
@@ -215,21 +458,38 @@ def _make_target_key(channel_id: Optional[int], guild_id: Optional[int]) -> str:
 
 def _already_sent_for_run(state: dict, target_key: str, run_at: datetime.datetime) -> bool:
     last = state.get(target_key)
-    if not isinstance(last, str) or not last:
+    if isinstance(last, str) and last:
+        # Entries written before epoch keys were ISO-8601 strings.
+        try:
+            last = int(datetime.datetime.fromisoformat(last).timestamp())
+        except ValueError:
+            return False
+    if not isinstance(last, int) or isinstance(last, bool):
         return False
-    return last == run_at.isoformat()
+    return last == int(run_at.timestamp())
 
 
 async def _resolve_fixed_channel() -> discord.abc.Messageable:
+    global _fixed_channel
     if CHANNEL_ID is None:
         raise RuntimeError("CHANNEL_ID is not set")
 
-    ch = client.get_channel(CHANNEL_ID)
+    if _fixed_channel is not None:
+        return _fixed_channel
+
+    # A single-guild bot can use that guild's own channel map instead of the global lookup.
+    guilds = client.guilds
+    if len(guilds) == 1:
+        ch = guilds[0].get_channel_or_thread(CHANNEL_ID)
+    else:
+        ch = client.get_channel(CHANNEL_ID)
     if ch is not None:
+        _fixed_channel = ch
         return ch
 
     try:
         fetched = await client.fetch_channel(CHANNEL_ID)
+        _fixed_channel = fetched
         return fetched
     except discord.NotFound:
         raise SystemExit(f"CHANNEL_ID {CHANNEL_ID} not found.")
@@ -239,46 +499,123 @@ async def _resolve_fixed_channel() -> discord.abc.Messageable:
         raise SystemExit(f"Failed to fetch CHANNEL_ID {CHANNEL_ID}: {type(e).__name__}: {e}")
 
 
+def _invalidate_fixed_channel() -> None:
+    global _fixed_channel
+    _fixed_channel = None
+
+
 async def _sleep_until(target: datetime.datetime) -> None:
     """
     Sleep until target time, robust against early wakeups and clock shifts.
     asyncio.sleep is cancellable; cancellation will propagate cleanly.
+
+    Sleeps run in chunks against a time.monotonic() deadline, and the wall clock is
+    re-read on each wakeup:
+    - a wall-clock step larger than CLOCK_DRIFT_SECONDS (suspend/resume, NTP, a manual
+      change) moves the deadline to match the wall clock;
+    - a smaller step is absorbed by waiting until both clocks agree, so a small backward
+      step extends the sleep and a small forward step can fire up to CLOCK_DRIFT_SECONDS late.
+    Remaining time is computed in UTC, since the difference between two instants doesn't
+    need the local zone's transition table.
     """
-    while True:
-        now = datetime.datetime.now(TZ)
-        remaining = (target - now).total_seconds()
+    target_utc = target.astimezone(_UTC)
+    remaining = (target_utc - datetime.datetime.now(_UTC)).total_seconds()
+    deadline = time.monotonic() + remaining
 
+    while True:
         # If we've reached or passed the target, don't sleep at all.
         if remaining <= 0:
-            if remaining < -60:
-                logger.warning(f"Clock jump detected: {abs(remaining):.0f}s behind schedule")
+            if remaining < -CLOCK_DRIFT_SECONDS:
+                logger.warning("Clock jump detected: %.0fs behind schedule", abs(remaining))
             return
 
-        # Sleep in chunks so we stay responsive to clock shifts/cancel.
-        await asyncio.sleep(min(60.0, remaining))
+        await asyncio.sleep(min(SLEEP_CHUNK_SECONDS, remaining))
 
+        wall_remaining = (target_utc - datetime.datetime.now(_UTC)).total_seconds()
+        mono_remaining = deadline - time.monotonic()
+        if abs(wall_remaining - mono_remaining) > CLOCK_DRIFT_SECONDS:
+            logger.warning(
+                "Wall clock moved %+.0fs relative to monotonic, resyncing", mono_remaining - wall_remaining
+            )
+            deadline = time.monotonic() + wall_remaining
+            remaining = wall_remaining
+        else:
+            # Never return before the wall clock agrees the target has arrived.
+            remaining = max(wall_remaining, mono_remaining)
 
-async def _send_once(channel: discord.abc.Messageable) -> None:
+
+async def _send_once(channel: discord.abc.Messageable, _gifs=_gif_cycle) -> None:
     can_mention = can_mention_everyone_in_channel(channel)
-    message_text = MESSAGE if can_mention else MESSAGE.replace("@everyone", "").strip()
+    message_text = MESSAGE if can_mention else MESSAGE_NO_PING
 
     if not can_mention and "@everyone" in MESSAGE:
         ch_id = getattr(channel, "id", None)
-        logger.warning(f"Cannot mention @everyone in channel {ch_id}, sending without ping")
+        logger.warning("Cannot mention @everyone in channel %s, sending without ping", ch_id)
 
-    gif = random.choice(TRASH_GIFS)
+    gif = next(_gifs)
 
     if DRY_RUN:
         ch_name = getattr(channel, "name", f"ID:{getattr(channel, 'id', 'unknown')}")
-        logger.info(f"[DRY RUN] Would send to {ch_name}: {message_text}\n{gif}")
+        logger.info("[DRY RUN] Would send to %s: %s\n%s", ch_name, message_text, gif)
         return
 
     await channel.send(
         f"{message_text}\n{gif}",
-        allowed_mentions=discord.AllowedMentions(everyone=can_mention),
+        allowed_mentions=_AM_EVERYONE if can_mention else _AM_NONE,
     )
 
 
+async def _send_to_guild(
+    guild: discord.Guild,
+    state: dict,
+    scheduled_at: datetime.datetime,
+    sem: asyncio.Semaphore,
+) -> bool:
+    """
+    Pick a channel, dedupe, and send for one guild. Returns True if a send was recorded in state.
+    """
+    channel = _cached_channel(state, guild) or pick_channel(guild)
+    if channel is None:
+        logger.warning("No postable channel found in guild: %s (ID: %s)", guild.name, guild.id)
+        return False
+
+    target_key = _make_target_key(None, guild.id)
+    if _already_sent_for_run(state, target_key, scheduled_at):
+        logger.info("Already sent for guild '%s' (ID: %s) at %s, skipping.", guild.name, guild.id, scheduled_at)
+        return False
+
+    try:
+        async with sem:
+            await _send_once(channel)
+
+        if not DRY_RUN:
+            await _record_sent(state, target_key, scheduled_at, guild.id, channel.id)
+            logger.info(
+                "Sent reminder in guild '%s' (ID: %s) channel '%s' (ID: %s) for %s",
+                guild.name,
+                guild.id,
+                channel.name,
+                channel.id,
+                scheduled_at,
+            )
+            return True
+
+        logger.info(
+            "[DRY RUN] Would update state for guild '%s' (ID: %s) at %s", guild.name, guild.id, scheduled_at
+        )
+    except discord.Forbidden:
+        logger.error("Forbidden: cannot send in guild '%s' (ID: %s).", guild.name, guild.id)
+    except discord.HTTPException as e:
+        logger.error(
+            "HTTP error sending in guild '%s' (ID: %s): %s: %s", guild.name, guild.id, type(e).__name__, e
+        )
+    except Exception as e:
+        logger.error(
+            "Failed to send in guild '%s' (ID: %s): %s: %s", guild.name, guild.id, type(e).__name__, e
+        )
+    return False
+
+
 async def _run_send_window(state: dict, scheduled_at: datetime.datetime) -> None:
     """
     Send reminders for the given scheduled time, deduped by state.json.
@@ -289,56 +626,41 @@ async def _run_send_window(state: dict, scheduled_at: datetime.datetime) -> None
             target_key = _make_target_key(CHANNEL_ID, None)
 
             if _already_sent_for_run(state, target_key, scheduled_at):
-                logger.info(f"Already sent for {target_key} at {scheduled_at.isoformat()}, skipping.")
+                logger.info("Already sent for %s at %s, skipping.", target_key, scheduled_at)
                 return
 
-            await _send_once(channel)
+            try:
+                await _send_once(channel)
+            except (discord.NotFound, discord.Forbidden):
+                # The cached channel may be stale; resolve it again next time.
+                _invalidate_fixed_channel()
+                raise
 
             if not DRY_RUN:
-                state[target_key] = scheduled_at.isoformat()
+                # A single send has nothing to batch, so skip the journal and save once.
+                state[target_key] = int(scheduled_at.timestamp())
                 _save_state(state)
-                logger.info(f"Sent reminder to fixed channel {CHANNEL_ID} for {scheduled_at.isoformat()}")
+                logger.info("Sent reminder to fixed channel %s for %s", CHANNEL_ID, scheduled_at)
             else:
-                logger.info(f"[DRY RUN] Would update state for {target_key} at {scheduled_at.isoformat()}")
+                logger.info("[DRY RUN] Would update state for %s at %s", target_key, scheduled_at)
             return
 
-        for guild in client.guilds:
-            channel = pick_channel(guild)
-            if channel is None:
-                logger.warning(f"No postable channel found in guild: {guild.name} (ID: {guild.id})")
-                continue
-
-            target_key = _make_target_key(None, guild.id)
-            if _already_sent_for_run(state, target_key, scheduled_at):
-                logger.info(
-                    f"Already sent for guild '{guild.name}' (ID: {guild.id}) at {scheduled_at.isoformat()}, skipping."
-                )
-                continue
-
-            try:
-                await _send_once(channel)
-
-                if not DRY_RUN:
-                    state[target_key] = scheduled_at.isoformat()
-                    _save_state(state)
-                    logger.info(
-                        f"Sent reminder in guild '{guild.name}' (ID: {guild.id}) "
-                        f"channel '{getattr(channel, 'name', 'unknown')}' (ID: {getattr(channel, 'id', 'unknown')}) "
-                        f"for {scheduled_at.isoformat()}"
-                    )
-                else:
-                    logger.info(
-                        f"[DRY RUN] Would update state for guild '{guild.name}' (ID: {guild.id}) "
-                        f"at {scheduled_at.isoformat()}"
-                    )
-            except discord.Forbidden:
-                logger.error(f"Forbidden: cannot send in guild '{guild.name}' (ID: {guild.id}).")
-            except discord.HTTPException as e:
-                logger.error(
-                    f"HTTP error sending in guild '{guild.name}' (ID: {guild.id}): {type(e).__name__}: {e}"
-                )
-            except Exception as e:
-                logger.error(f"Failed to send in guild '{guild.name}' (ID: {guild.id}): {type(e).__name__}: {e}")
+        sem = asyncio.Semaphore(SEND_CONCURRENCY)
+        results = await asyncio.gather(
+            *(_send_to_guild(guild, state, scheduled_at, sem) for guild in client.guilds),
+            return_exceptions=True,
+        )
+        sent = 0
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("Guild send task failed: %s: %s", type(result).__name__, result)
+            elif result:
+                sent += 1
+
+        # Sends were journaled one line each; fold them into state.json once for the whole window.
+        # gather has finished, so nothing else touches state while the worker thread writes it.
+        if sent:
+            await asyncio.to_thread(_compact_state, state)
 
     except SystemExit as e:
         logger.critical(str(e))
@@ -351,9 +673,13 @@ async def _run_send_window(state: dict, scheduled_at: datetime.datetime) -> None
 async def schedule_loop():
     state = _load_state()
     logger.info(
-        f"Starting scheduler: weekday={TARGET_WEEKDAY}, time={TARGET_HOUR:02d}:{TARGET_MINUTE:02d}, "
-        f"tz={TIMEZONE}, catch_up={CATCH_UP}, "
-        f"catch_up_max_hours={CATCH_UP_MAX_HOURS if CATCH_UP_MAX_HOURS is not None else 'unlimited'}"
+        "Starting scheduler: weekday=%d, time=%02d:%02d, tz=%s, catch_up=%s, catch_up_max_hours=%s",
+        TARGET_WEEKDAY,
+        TARGET_HOUR,
+        TARGET_MINUTE,
+        TIMEZONE,
+        CATCH_UP,
+        CATCH_UP_MAX_HOURS if CATCH_UP_MAX_HOURS is not None else "unlimited",
     )
 
     try:
@@ -370,17 +696,16 @@ async def schedule_loop():
                     next_scheduled = next_run_after(now)
                 else:
                     logger.debug(
-                        f"Skipping catch-up: last scheduled was {hours_since_last:.1f}h ago "
-                        f"(max={CATCH_UP_MAX_HOURS}h)"
+                        "Skipping catch-up: last scheduled was %.1fh ago (max=%sh)",
+                        hours_since_last,
+                        CATCH_UP_MAX_HOURS,
                     )
 
-            logger.info(f"Next run: {next_scheduled.isoformat()}")
+            logger.info("Next run: %s", next_scheduled)
             await _sleep_until(next_scheduled)
 
             await _run_send_window(state, next_scheduled)
 
-            await asyncio.sleep(1)
-
     except asyncio.CancelledError:
         logger.info("Scheduler task cancelled")
         raise
@@ -391,22 +716,40 @@ async def schedule_loop():
 
 @client.event
 async def on_ready():
-    logger.info(f"Logged in as {client.user} (ID: {getattr(client.user, 'id', 'unknown')})")
+    global _schedule_task
+    logger.info("Logged in as %s (ID: %s)", client.user, getattr(client.user, "id", "unknown"))
+
+    # A fresh READY rebuilds the guild cache; drop any channel object from the old one.
+    _invalidate_fixed_channel()
 
     if CHANNEL_ID is not None:
         try:
             ch = await _resolve_fixed_channel()
             logger.info(
-                f"Posting to fixed channel: {getattr(ch, 'name', 'unknown')} (ID: {CHANNEL_ID}), "
-                f"type={type(ch).__name__}"
+                "Posting to fixed channel: %s (ID: %s), type=%s",
+                getattr(ch, "name", "unknown"),
+                CHANNEL_ID,
+                type(ch).__name__,
             )
         except SystemExit as e:
             logger.critical(str(e))
             await client.close()
             return
 
-    if not hasattr(client, "_schedule_task"):
-        client._schedule_task = asyncio.create_task(schedule_loop())
+    if _schedule_task is None:
+        _schedule_task = asyncio.create_task(schedule_loop())
+
+
+@client.event
+async def on_guild_channel_delete(channel):
+    if channel.id == CHANNEL_ID:
+        _invalidate_fixed_channel()
+
+
+@client.event
+async def on_guild_channel_update(before, after):
+    if after.id == CHANNEL_ID:
+        _invalidate_fixed_channel()
 
 
 try:
@@ -414,4 +757,4 @@ try:
 except KeyboardInterrupt:
     logger.info("Bot stopped by user")
 except Exception as e:
-    logger.critical(f"Bot failed to start: {type(e).__name__}: {e}")
+    logger.critical("Bot failed to start: %s: %s", type(e).__name__, e)